@@ -19,6 +19,11 @@ class ArtifactStore(metaclass=ABCMeta):
     async def load(self, node_id: NodeId) -> t.Any:
         ...
 
+    async def flush(self) -> None:  # noqa: B027
+        """
+        Сохранить артефакты, запись которых была отложена. Вызывается перед завершением пайплайна
+        """
+
 
 class SerializedArtifactStore(ArtifactStore, metaclass=ABCMeta):
     def __init__(self, ctx: PipelineContextLike, *args: t.Any, **kwargs: t.Any) -> None:
@@ -0,0 +1,96 @@
+import asyncio
+import typing as t
+from abc import ABCMeta
+from abc import abstractmethod
+
+from ml_pipeline_engine.artifact_store.store.base import ArtifactStore
+from ml_pipeline_engine.types import NodeId
+from ml_pipeline_engine.types import PipelineContextLike
+
+
+class BufferedArtifactStore(ArtifactStore, metaclass=ABCMeta):
+    """
+    Хранилище артефактов с отложенной пакетной записью
+
+    Результаты узлов накапливаются в памяти и спустя flush_delay секунд после первой записи сохраняются
+    одним вызовом save_batch (например, MSET в Redis). Контекст пайплайна сбрасывает оставшиеся результаты
+    перед завершением пайплайна.
+    """
+
+    flush_delay: t.ClassVar[float] = 0.005
+
+    def __init__(self, ctx: PipelineContextLike, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(ctx, *args, **kwargs)
+
+        self._pending: t.Dict[NodeId, t.Any] = {}
+        self._flush_handle: t.Optional[asyncio.TimerHandle] = None
+        self._flush_task: t.Optional[asyncio.Task] = None
+
+    @abstractmethod
+    async def save_batch(self, items: t.Dict[NodeId, t.Any]) -> None:
+        """
+        Сохранить несколько артефактов одним запросом
+        """
+
+    @abstractmethod
+    async def load_saved(self, node_id: NodeId) -> t.Any:
+        """
+        Загрузить артефакт, который уже был сохранен
+        """
+
+    async def save(self, node_id: NodeId, data: t.Any) -> None:
+        self._pending[node_id] = data
+
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.flush_delay, self._start_flush)
+
+    async def load(self, node_id: NodeId) -> t.Any:
+        if node_id in self._pending:
+            return self._pending[node_id]
+
+        return await self.load_saved(node_id)
+
+    async def flush(self) -> None:
+        """
+        Сохранить все накопленные артефакты
+        """
+
+        while True:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+
+            if self._flush_task is None:
+                if not self._pending:
+                    return
+
+                self._flush_task = asyncio.ensure_future(self._save_pending())
+
+            # The task stays registered while it's awaited, so _start_flush doesn't start another one meanwhile.
+            # Results saved during the wait are saved on the next iteration.
+            flush_task = self._flush_task
+
+            try:
+                await flush_task
+            finally:
+                if self._flush_task is flush_task:
+                    self._flush_task = None
+
+    def _start_flush(self) -> None:
+        # The previous batch is still being saved, so the next one is postponed to avoid concurrent writes
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_handle = asyncio.get_running_loop().call_later(self.flush_delay, self._start_flush)
+            return
+
+        self._flush_handle = None
+        self._flush_task = asyncio.ensure_future(self._save_pending())
+
+    async def _save_pending(self) -> None:
+        items = dict(self._pending)
+
+        await self.save_batch(items)
+
+        # Results stay available for load() until they are saved. A result may be replaced during the saving.
+        for node_id, data in items.items():
+            if self._pending.get(node_id) is data:
+                del self._pending[node_id]
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from dataclasses import field
 
 from ml_pipeline_engine.context import dag as dag_ctx
+from ml_pipeline_engine.logs import logger_manager as logger
 from ml_pipeline_engine.node import generate_pipeline_id
 from ml_pipeline_engine.types import ArtifactStoreLike
 from ml_pipeline_engine.types import DAGLike
@@ -55,8 +56,11 @@ class PipelineChart(PipelineChartBase, PipelineChartLike):
         await ctx.emit_on_pipeline_start()
 
         try:
+            value = await self.entrypoint.run(ctx)
+            await ctx.flush_node_results()
+
             result = PipelineResult(
-                value=await self.entrypoint.run(ctx),
+                value=value,
                 pipeline_id=pipeline_id,
                 error=None,
             )
@@ -65,6 +69,12 @@ class PipelineChart(PipelineChartBase, PipelineChartLike):
             return result
 
         except Exception as ex:
+            try:
+                # The results of the nodes that have been completed before the error are saved as well
+                await ctx.flush_node_results()
+            except Exception as flush_ex:
+                logger.error('Unable to save the node results, pipeline_id=%s', pipeline_id, exc_info=flush_ex)
+
             result = PipelineResult(pipeline_id=pipeline_id, value=None, error=ex)
             await ctx.emit_on_pipeline_complete(result=result)
 
@@ -38,6 +38,9 @@ class DAGPipelineContext(EventSourceMixin, PipelineContextLike):
     async def save_node_result(self, node_id: NodeId, data: t.Any) -> None:
         await self.artifact_store.save(node_id=node_id, data=data)
 
+    async def flush_node_results(self) -> None:
+        await self.artifact_store.flush()
+
     @property
     def model_name(self) -> ModelName:
         return self.chart.model_name
@@ -1,3 +1,4 @@
 from ml_pipeline_engine.dag.dag import *  # noqa
 from ml_pipeline_engine.dag.enums import *  # noqa
+from ml_pipeline_engine.dag.layout import *  # noqa
 from ml_pipeline_engine.dag.manager import *  # noqa
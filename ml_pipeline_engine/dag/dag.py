@@ -7,6 +7,7 @@ from ml_pipeline_engine.dag.manager import DAGRunConcurrentManager
 from ml_pipeline_engine.node.retrying import NodeRetryPolicy
 from ml_pipeline_engine.parallelism import process_pool_registry
 from ml_pipeline_engine.parallelism import threads_pool_registry
+from ml_pipeline_engine.types import DAGLayoutLike
 from ml_pipeline_engine.types import DAGLike
 from ml_pipeline_engine.types import DAGRunManagerLike
 from ml_pipeline_engine.types import NodeBase
@@ -24,6 +25,8 @@ class DAG(DAGLike):
     is_process_pool_needed: bool
     is_thread_pool_needed: bool
     node_map: t.Dict[NodeId, NodeBase]
+    layout: DAGLayoutLike
+    is_linear: bool
     retry_policy: t.Type[RetryPolicyLike] = NodeRetryPolicy
     run_manager: t.Type[DAGRunManagerLike] = DAGRunConcurrentManager
 
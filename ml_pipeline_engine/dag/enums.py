@@ -1,3 +1,5 @@
+import sys
+import typing as t
 from enum import Enum
 
 
@@ -15,3 +17,18 @@ class EdgeField(str, Enum):
     kwarg_name = 'kwarg_name'
     is_switch = 'is_switch'
     case_branch = 'case_branch'
+
+
+# Plain interned strings for the graph attribute keys. They are used on the hot path instead of the enum members
+# because lookups with them don't go through the enum's __hash__ and __eq__.
+NF_IS_SWITCH: t.Final[str] = sys.intern(NodeField.is_switch.value)
+NF_IS_ONEOF_HEAD: t.Final[str] = sys.intern(NodeField.is_oneof_head.value)
+NF_IS_ONEOF_CHILD: t.Final[str] = sys.intern(NodeField.is_oneof_child.value)
+NF_ONEOF_NODES: t.Final[str] = sys.intern(NodeField.oneof_nodes.value)
+NF_START_NODE: t.Final[str] = sys.intern(NodeField.start_node.value)
+NF_MAX_ITERATIONS: t.Final[str] = sys.intern(NodeField.max_iterations.value)
+NF_ADDITIONAL_DATA: t.Final[str] = sys.intern(NodeField.additional_data.value)
+
+EF_KWARG_NAME: t.Final[str] = sys.intern(EdgeField.kwarg_name.value)
+EF_IS_SWITCH: t.Final[str] = sys.intern(EdgeField.is_switch.value)
+EF_CASE_BRANCH: t.Final[str] = sys.intern(EdgeField.case_branch.value)
@@ -8,3 +8,7 @@ class OneOfDoesNotHaveResultError(BaseDagError):
 
 class RecurrentSubgraphDoesNotHaveResultError(BaseDagError):
     pass
+
+
+class DAGCycleError(BaseDagError):
+    pass
@@ -0,0 +1,219 @@
+import typing as t
+from array import array
+from dataclasses import dataclass
+
+import networkx as nx
+
+from ml_pipeline_engine.dag.enums import EF_CASE_BRANCH
+from ml_pipeline_engine.dag.enums import EF_IS_SWITCH
+from ml_pipeline_engine.dag.enums import EF_KWARG_NAME
+from ml_pipeline_engine.dag.enums import NF_IS_ONEOF_HEAD
+from ml_pipeline_engine.dag.enums import NF_IS_SWITCH
+from ml_pipeline_engine.dag.enums import NF_ONEOF_NODES
+from ml_pipeline_engine.dag.errors import DAGCycleError
+from ml_pipeline_engine.node.enums import ExecMode
+from ml_pipeline_engine.node.node import get_exec_mode
+from ml_pipeline_engine.types import CaseLabel
+from ml_pipeline_engine.types import DAGLayoutLike
+from ml_pipeline_engine.types import NodeBase
+from ml_pipeline_engine.types import NodeId
+
+__all__ = [
+    'FLAG_IS_ONEOF_HEAD',
+    'FLAG_IS_RECURRENT',
+    'FLAG_IS_SWITCH',
+    'DAGLayout',
+    'build_layout',
+    'iter_bits',
+]
+
+FLAG_IS_SWITCH = 1 << 0
+FLAG_IS_ONEOF_HEAD = 1 << 1
+FLAG_IS_RECURRENT = 1 << 2
+
+
+@dataclass(frozen=True)
+class DAGLayout(DAGLayoutLike):
+    """
+    Flat (CSR) representation of the DAG's structure.
+
+    Predecessors of the node with index i are stored in pred_nodes[pred_offsets[i]:pred_offsets[i + 1]],
+    pred_case_branch and pred_is_switch hold the attributes of the corresponding edges,
+    pred_is_switch is set for the edge from the node that decides the switch's branch.
+    node_flags holds one byte per node with FLAG_* bits, so a node is checked with a single mask.
+    FLAG_IS_RECURRENT marks nodes that may return a Recurrent result (including OneOf heads that copy it).
+    oneof_candidates holds the ordered candidates of every OneOf head.
+    kwarg_layout holds (kwarg name, predecessor id, is the predecessor a switch) for the node's inputs.
+    succ_bitmask holds an int per node where bit j is set if the node with index j is a successor of the node.
+    layers holds the topological generations of node indexes.
+    exec_modes holds the ExecMode of every node, synthetic nodes don't have a run method and are marked as coroutines.
+    """
+
+    node_ids: t.Tuple[NodeId, ...]
+    node_index: t.Dict[NodeId, int]
+    pred_offsets: array
+    pred_nodes: array
+    pred_case_branch: t.Tuple[t.Optional[CaseLabel], ...]
+    pred_is_switch: bytes
+    node_flags: bytes
+    oneof_candidates: t.Dict[NodeId, t.Tuple[NodeId, ...]]
+    kwarg_layout: t.Tuple[t.Tuple[t.Tuple[str, NodeId, bool], ...], ...]
+    succ_bitmask: t.Tuple[int, ...]
+    layers: t.Tuple[t.Tuple[int, ...], ...]
+    exec_modes: bytes
+
+    def get_node_flags(self, node_id: NodeId) -> int:
+        """
+        Get FLAG_* bits of the node. Unknown nodes don't have any flags
+        """
+
+        node_idx = self.node_index.get(node_id)
+        return 0 if node_idx is None else self.node_flags[node_idx]
+
+    def get_pred_range(self, node_idx: int) -> range:
+        """
+        Get positions of the node's predecessors in the pred_* arrays
+        """
+
+        return range(self.pred_offsets[node_idx], self.pred_offsets[node_idx + 1])
+
+    def get_pred_ids(self, node_id: NodeId) -> t.List[NodeId]:
+        """
+        Get ids of the node's predecessors
+        """
+
+        return [self.node_ids[self.pred_nodes[pos]] for pos in self.get_pred_range(self.node_index[node_id])]
+
+
+def iter_bits(mask: int) -> t.Iterator[int]:
+    """
+    Iterate over indexes of the set bits, starting from the lowest one
+    """
+
+    while mask:
+        bit = mask & -mask
+        yield bit.bit_length() - 1
+        mask ^= bit
+
+
+def _get_topological_layers(
+    pred_offsets: array,
+    succ_offsets: array,
+    succ_nodes: array,
+) -> t.Tuple[t.Tuple[int, ...], ...]:
+    """
+    Split the nodes into topological generations with Kahn's algorithm.
+    A node is placed into the first layer after all of its predecessors.
+    """
+
+    node_count = len(pred_offsets) - 1
+    indegree = array('i', (pred_offsets[idx + 1] - pred_offsets[idx] for idx in range(node_count)))
+
+    layers = []
+    layer = [idx for idx in range(node_count) if not indegree[idx]]
+    n_visited = 0
+
+    while layer:
+        layers.append(tuple(layer))
+        n_visited += len(layer)
+
+        next_layer = []
+
+        for idx in layer:
+            for pos in range(succ_offsets[idx], succ_offsets[idx + 1]):
+                succ_idx = succ_nodes[pos]
+                indegree[succ_idx] -= 1
+
+                if not indegree[succ_idx]:
+                    next_layer.append(succ_idx)
+
+        layer = next_layer
+
+    if n_visited != node_count:
+        raise DAGCycleError('The graph contains a cycle')
+
+    return tuple(layers)
+
+
+def build_layout(graph: nx.DiGraph, node_map: t.Dict[NodeId, NodeBase]) -> DAGLayout:
+    """
+    Convert the graph into the flat representation
+    """
+
+    node_ids = tuple(graph.nodes)
+    node_index = {node_id: idx for idx, node_id in enumerate(node_ids)}
+
+    pred_offsets = array('i', [0])
+    pred_nodes = array('i')
+    succ_offsets = array('i', [0])
+    succ_nodes = array('i')
+    pred_kwargs = []
+    pred_case_branch = []
+    pred_is_switch = bytearray()
+
+    node_flags = bytearray(len(node_ids))
+    succ_bitmask = [0] * len(node_ids)
+    oneof_candidates = {}
+
+    for idx, node_id in enumerate(node_ids):
+        for pred_node_id, edge in graph.pred[node_id].items():
+            pred_nodes.append(node_index[pred_node_id])
+            succ_bitmask[node_index[pred_node_id]] |= 1 << idx
+            pred_kwargs.append(edge.get(EF_KWARG_NAME))
+            pred_case_branch.append(edge.get(EF_CASE_BRANCH))
+            pred_is_switch.append(edge.get(EF_IS_SWITCH) is True)
+
+        pred_offsets.append(len(pred_nodes))
+
+        succ_nodes.extend(node_index[succ_node_id] for succ_node_id in graph.succ[node_id])
+        succ_offsets.append(len(succ_nodes))
+
+        node = graph.nodes[node_id]
+        node_flags[idx] = (
+            FLAG_IS_SWITCH * (node.get(NF_IS_SWITCH) is True)
+            | FLAG_IS_ONEOF_HEAD * (node.get(NF_IS_ONEOF_HEAD) is True)
+            | FLAG_IS_RECURRENT * callable(getattr(node_map.get(node_id), 'next_iteration', None))
+        )
+
+        if NF_ONEOF_NODES in node:
+            oneof_candidates[node_id] = tuple(node[NF_ONEOF_NODES])
+
+    # A OneOf head copies the result of its candidate, so it may be Recurrent too. Heads can be nested.
+    has_changes = True
+    while has_changes:
+        has_changes = False
+
+        for node_id, candidates in oneof_candidates.items():
+            idx = node_index[node_id]
+
+            if not node_flags[idx] & FLAG_IS_RECURRENT and any(
+                node_flags[node_index[candidate]] & FLAG_IS_RECURRENT for candidate in candidates
+            ):
+                node_flags[idx] |= FLAG_IS_RECURRENT
+                has_changes = True
+
+    kwarg_layout = tuple(
+        tuple(
+            (pred_kwargs[pos], node_ids[pred_nodes[pos]], bool(node_flags[pred_nodes[pos]] & FLAG_IS_SWITCH))
+            for pos in range(pred_offsets[idx], pred_offsets[idx + 1])
+            if pred_kwargs[pos] is not None
+        )
+        for idx in range(len(node_ids))
+    )
+
+    return DAGLayout(
+        node_ids=node_ids,
+        node_index=node_index,
+        pred_offsets=pred_offsets,
+        pred_nodes=pred_nodes,
+        pred_case_branch=tuple(pred_case_branch),
+        pred_is_switch=bytes(pred_is_switch),
+        node_flags=bytes(node_flags),
+        oneof_candidates=oneof_candidates,
+        kwarg_layout=kwarg_layout,
+        succ_bitmask=tuple(succ_bitmask),
+        layers=_get_topological_layers(pred_offsets, succ_offsets, succ_nodes),
+        exec_modes=bytes(
+            get_exec_mode(node_map[node_id]) if node_id in node_map else ExecMode.coroutine for node_id in node_ids
+        ),
+    )
@@ -10,17 +10,24 @@ import networkx as nx
 from cachetools import cachedmethod
 from cachetools.keys import hashkey
 
-from ml_pipeline_engine.dag.enums import EdgeField
-from ml_pipeline_engine.dag.enums import NodeField
+from ml_pipeline_engine.dag.enums import EF_CASE_BRANCH
+from ml_pipeline_engine.dag.enums import NF_ADDITIONAL_DATA
+from ml_pipeline_engine.dag.enums import NF_IS_ONEOF_CHILD
+from ml_pipeline_engine.dag.enums import NF_MAX_ITERATIONS
+from ml_pipeline_engine.dag.enums import NF_START_NODE
 from ml_pipeline_engine.dag.errors import OneOfDoesNotHaveResultError
 from ml_pipeline_engine.dag.errors import RecurrentSubgraphDoesNotHaveResultError
 from ml_pipeline_engine.dag.graph import DiGraph
 from ml_pipeline_engine.dag.graph import get_connected_subgraph
+from ml_pipeline_engine.dag.layout import FLAG_IS_ONEOF_HEAD
+from ml_pipeline_engine.dag.layout import FLAG_IS_RECURRENT
+from ml_pipeline_engine.dag.layout import FLAG_IS_SWITCH
+from ml_pipeline_engine.dag.layout import iter_bits
 from ml_pipeline_engine.dag.storage import DAGNodeStorage
 from ml_pipeline_engine.logs import logger_manager as logger
 from ml_pipeline_engine.logs import logger_manager_lock as lock_logger
-from ml_pipeline_engine.node import run_node
 from ml_pipeline_engine.node import run_node_default
+from ml_pipeline_engine.node import run_node_in_mode
 from ml_pipeline_engine.node.retrying import NodeRetryPolicy
 from ml_pipeline_engine.types import CaseResult
 from ml_pipeline_engine.types import DAGLike
@@ -33,6 +40,37 @@ from ml_pipeline_engine.types import Recurrent
 _EventDictT = t.Dict[t.Any, asyncio.Event]
 _ConditionT = t.Dict[t.Any, asyncio.Condition]
 
+# Python 3.12+ is able to run the first step of a coroutine inline, so a coroutine that completes without suspension
+# doesn't pay for the event loop round-trip
+_eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+
+
+class ConditionInbox:
+    """
+    Collects notifications sent to a group of conditions, so a single waiter can watch all of them
+    """
+
+    __slots__ = ('_event', '_notified')
+
+    def __init__(self) -> None:
+        self._event = asyncio.Event()
+        self._notified: t.Set[t.Any] = set()
+
+    def notify(self, condition_name: t.Any) -> None:
+        self._notified.add(condition_name)
+        self._event.set()
+
+    async def wait(self) -> t.Set[t.Any]:
+        """
+        Wait for notifications and return the names of the notified conditions
+        """
+
+        await self._event.wait()
+        self._event.clear()
+
+        notified, self._notified = self._notified, set()
+        return notified
+
 
 @dataclass
 class DAGConcurrentManagerLock:
@@ -43,6 +81,9 @@ class DAGConcurrentManagerLock:
     condition_lock_store: _ConditionT = field(
         default_factory=functools.partial(defaultdict, asyncio.Condition),
     )
+    inbox_store: t.Dict[t.Any, t.List[ConditionInbox]] = field(
+        default_factory=functools.partial(defaultdict, list),
+    )
 
     @property
     def conditions(self) -> _ConditionT:
@@ -78,6 +119,21 @@ class DAGConcurrentManagerLock:
             lock_logger.debug('Send a notification to unlock %s', condition_name)
             condition.notify_all()
 
+        for inbox in self.inbox_store.get(condition_name, ()):
+            inbox.notify(condition_name)
+
+    def subscribe(self, inbox: ConditionInbox, condition_names: t.Iterable[t.Any]) -> None:
+        """
+        Deliver notifications of the conditions to the inbox
+        """
+
+        for condition_name in condition_names:
+            self.inbox_store[condition_name].append(inbox)
+
+    def unsubscribe(self, inbox: ConditionInbox, condition_names: t.Iterable[t.Any]) -> None:
+        for condition_name in condition_names:
+            self.inbox_store[condition_name].remove(inbox)
+
 
 def cache_key(prefix: str, _: t.Any, *args: t.Any, **kwargs: t.Any) -> t.Type[tuple]:
     """Custom func key generation excluding 'self'."""
@@ -128,12 +184,21 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
         return None
 
-    def _create_task(self, coro: t.Coroutine, name: str) -> asyncio.Task:
+    def _create_task(self, coro: t.Coroutine, name: str, eager: bool = False) -> asyncio.Task:
         """
         Create asyncio.Task and collect it to the main DAG's storage
+
+        Args:
+            coro: Coroutine to run
+            name: Task name
+            eager: Run the first step of the coroutine inline if the interpreter supports it
         """
 
-        task = asyncio.create_task(coro, name=name)
+        if eager and _eager_task_factory is not None:
+            task = _eager_task_factory(asyncio.get_running_loop(), coro, name=name)
+        else:
+            task = asyncio.create_task(coro, name=name)
+
         self._coro_tasks.add(task)
 
         return task
@@ -144,11 +209,15 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         """
 
         try:
+            if self.dag.is_linear:
+                return await self._run_linear()
+
             self._create_task(
                 self._run_dag(
                     self._get_reduced_dag(self.dag.input_node, self.dag.output_node),
                 ),
                 self._alias_run_method,
+                eager=True,
             )
 
             await self._lock_manager.wait_for_condition(
@@ -166,6 +235,34 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         finally:
             self._stop_coro_tasks(*self._coro_tasks)
 
+    async def _run_linear(self) -> NodeResultT:
+        """
+        Run the DAG that is a chain of nodes.
+        The nodes are executed one by one in the current task, so neither tasks nor locks are needed.
+        """
+
+        logger.debug('Start linear DAG execution')
+
+        node_ids = self.dag.layout.node_ids
+        result = None
+
+        for (node_idx,) in self.dag.layout.layers:
+            node_id = node_ids[node_idx]
+            result = await self._execute_node(dag=self.dag.graph, node_id=node_id)
+
+            await self._save_node_result(node_id, result)
+
+        return result
+
+    async def _save_node_result(self, node_id: NodeId, result: t.Any) -> None:
+        """
+        Save the node's result to the node storage and to the artifact store
+        """
+
+        logger.debug('Save the result "%s" for the node %s', result, node_id)
+        self._node_storage.set_node_result(node_id, result)
+        await self.ctx.save_node_result(node_id, result)
+
     def _get_dag_result(self) -> NodeResultT:
         """
         Get the DAG's result or raise an error if there are any errors
@@ -187,31 +284,21 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         kwargs = {}
 
         if node_id != self.dag.input_node:
-            for pred_node_id in self.dag.graph.predecessors(node_id):
-                kwarg_name = self.dag.graph.edges[(pred_node_id, node_id)].get(EdgeField.kwarg_name)
-
-                if kwarg_name is None:
-                    continue
+            layout = self.dag.layout
 
-                if self._is_switch(pred_node_id):
-                    kwargs[kwarg_name] = self._node_storage.get_node_result(
-                        self._node_storage.get_switch_result(pred_node_id).node_id,
-                        with_hidden=True,
-                    )
+            for kwarg_name, pred_node_id, is_switch in layout.kwarg_layout[layout.node_index[node_id]]:
+                if is_switch:
+                    pred_node_id = self._node_storage.get_switch_result(pred_node_id).node_id  # noqa: PLW2901
 
-                else:
-                    kwargs[kwarg_name] = self._node_storage.get_node_result(
-                        pred_node_id,
-                        with_hidden=True,
-                    )
+                kwargs[kwarg_name] = self._node_storage.get_node_result(pred_node_id, with_hidden=True)
 
         else:
             kwargs = self.ctx.input_kwargs
 
-        additional_data = self.dag.graph.nodes[node_id].get(NodeField.additional_data)
+        additional_data = self.dag.graph.nodes[node_id].get(NF_ADDITIONAL_DATA)
 
         if additional_data is not None:
-            kwargs[NodeField.additional_data] = additional_data
+            kwargs[NF_ADDITIONAL_DATA] = additional_data
 
         return kwargs
 
@@ -220,16 +307,13 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         Checks if the node is a switch
         """
 
-        try:
-            return self.dag.graph.nodes[node_id].get(NodeField.is_switch) is True
-        except KeyError:
-            return False
+        return bool(self.dag.layout.get_node_flags(node_id) & FLAG_IS_SWITCH)
 
     def _is_head_of_oneof(self, node_id: NodeId) -> bool:
         """
         Checks if the node is the head of OneOf
         """
-        return bool(self.dag.graph.nodes[node_id].get(NodeField.is_oneof_head))
+        return bool(self.dag.layout.get_node_flags(node_id) & FLAG_IS_ONEOF_HEAD)
 
     def _get_reduced_dag(
         self,
@@ -245,25 +329,25 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
         def _filter(u: str, v: str) -> bool:
             """
-            Delete edges with EdgeField.case_branch from subgraph_view
+            Delete edges with EF_CASE_BRANCH from subgraph_view
 
             Args:
                 u - Node
                 v - Node Edge
             """
-            return not self.dag.graph.edges[u, v].get(EdgeField.case_branch)
+            return not self.dag.graph.edges[u, v].get(EF_CASE_BRANCH)
 
         def _filter_node(u: str) -> bool:
             """
-            Delete nodes with NodeField.is_oneof_child from subgraph_view
+            Delete nodes with NF_IS_ONEOF_CHILD from subgraph_view
 
             Args:
                 u -  Node
             """
-            return not self.dag.graph.nodes[u].get(NodeField.is_oneof_child)
+            return not self.dag.graph.nodes[u].get(NF_IS_ONEOF_CHILD)
 
         if is_oneof:
-            self.dag.graph.nodes[dest][NodeField.is_oneof_child] = False
+            self.dag.graph.nodes[dest][NF_IS_ONEOF_CHILD] = False
 
         return get_connected_subgraph(
             dag=nx.subgraph_view(self.dag.graph, filter_edge=_filter, filter_node=_filter_node),
@@ -279,16 +363,18 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         Save the switch branch
         """
 
+        layout = self.dag.layout
+
         selected_branch_label = None
         branch_nodes = {}
-        for pred_id in self.dag.graph.predecessors(switch_node_id):
-            edge = self.dag.graph.edges[(pred_id, switch_node_id)]
+        for pos in layout.get_pred_range(layout.node_index[switch_node_id]):
+            pred_id = layout.node_ids[layout.pred_nodes[pos]]
 
-            if edge.get(EdgeField.is_switch):
+            if layout.pred_is_switch[pos]:
                 selected_branch_label = self._node_storage.get_node_result(pred_id)
                 continue
 
-            branch_nodes[edge.get(EdgeField.case_branch)] = pred_id
+            branch_nodes[layout.pred_case_branch[pos]] = pred_id
 
         self._node_storage.set_switch_result(
             switch_node_id,
@@ -358,6 +444,12 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         node = self.dag.node_map[node_id]
 
         retry_policy = NodeRetryPolicy(node=node)
+        exec_mode = self.dag.layout.exec_modes[self.dag.layout.node_index[node_id]]
+
+        # The policy's properties are resolved once instead of on every attempt
+        attempts = retry_policy.attempts
+        delay = retry_policy.delay
+        exceptions = retry_policy.exceptions
 
         n_attempts = 1
         while True:
@@ -366,20 +458,20 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
                     return run_node_default(node, **kwargs)
 
                 logger.debug('Start execution node_id=%s', node_id)
-                result = await run_node(**kwargs, node=node, node_id=node_id)
+                result = await run_node_in_mode(node, exec_mode, (), kwargs, node_id=node_id)
 
                 logger.debug('Finish the node execution, node_id=%s', node_id)
                 return result
 
-            except retry_policy.exceptions as error:  # noqa: PERF203
+            except exceptions as error:  # noqa: PERF203
                 logger.debug(
                     'Node %s will be restarted in %s seconds...',
                     node_id,
-                    retry_policy.delay,
+                    delay,
                     exc_info=error,
                 )
 
-                if n_attempts == retry_policy.attempts:
+                if n_attempts == attempts:
                     if node.use_default:
                         return run_node_default(node, **kwargs)
 
@@ -388,7 +480,9 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
                 await self.ctx.emit_on_node_complete(node_id=node_id, error=error)
 
                 n_attempts += 1
-                await asyncio.sleep(retry_policy.delay)
+
+                if delay:
+                    await asyncio.sleep(delay)
 
             except Exception:
                 if node.use_default:
@@ -398,13 +492,18 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
     def _get_node_order(self, dag: DiGraph) -> t.List[NodeId]:
         """
-        Calculate the order for nodes according to the dag's type
+        Calculate the order for nodes according to the dag's type.
+        The order is taken from the precomputed layers of the main DAG, so the subgraph is not sorted again.
         """
 
+        node_ids = self.dag.layout.node_ids
+
         return [
             node_id
-            for node_id in nx.topological_sort(dag)
-            if (not self._node_storage.exists_processed_node(node_id) if not dag.is_recurrent else True)
+            for layer in self.dag.layout.layers
+            for node_id in map(node_ids.__getitem__, layer)
+            if node_id in dag
+            and (not self._node_storage.exists_processed_node(node_id) if not dag.is_recurrent else True)
         ]
 
     @cachedmethod(lambda self: self._memorization_store, key=functools.partial(cache_key, 'node_dependencies'))
@@ -413,10 +512,7 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         Get the node's dependencies
         """
 
-        node_predecessors = set(self.dag.graph.predecessors(node_id))
-        current_dag = set(nx.topological_sort(dag))
-
-        return current_dag.intersection(node_predecessors)
+        return set(self.dag.layout.get_pred_ids(node_id)).intersection(dag.nodes)
 
     def _get_predecessors(self, dag: DiGraph, node_id: NodeId) -> t.List[NodeId]:
         """
@@ -425,8 +521,8 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
         predecessors = list(
             self._get_node_dependencies(dag, node_id)
-            if self._is_switch(node_id) or self._is_head_of_oneof(node_id) or dag.is_recurrent
-            else self.dag.graph.predecessors(node_id),
+            if self.dag.layout.get_node_flags(node_id) & (FLAG_IS_SWITCH | FLAG_IS_ONEOF_HEAD) or dag.is_recurrent
+            else self.dag.layout.get_pred_ids(node_id),
         )
 
         for idx, predecessors_node_id in enumerate(predecessors):
@@ -443,12 +539,18 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
         logger.debug('Checking if the node can be executed node_id=%s', node_id)
 
+        get_node_flags = self.dag.layout.get_node_flags
+
         for pred_node_id in self._get_predecessors(dag, node_id):
             if (
                 not self._node_storage.exists_node_result(pred_node_id)
                 # The node cannot be executed if there is a "Recurrent" result in the node's dependencies.
                 # Hence, the node should wait for proper a result or an error.
-                or isinstance(self._node_storage.get_node_result(pred_node_id), Recurrent)
+                # Only nodes with FLAG_IS_RECURRENT are able to return such a result.
+                or (
+                    get_node_flags(pred_node_id) & FLAG_IS_RECURRENT
+                    and isinstance(self._node_storage.get_node_result(pred_node_id), Recurrent)
+                )
             ):
                 logger.debug(
                     'The node %s cannot be executed due to absense the dependent result of the node %s',
@@ -478,35 +580,41 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
             return None
 
         local_tasks = []
+        node_order = {node_id: idx for idx, node_id in enumerate(list_node_ids)}
+        pending = set(list_node_ids)
 
-        for node_id in list_node_ids:
-            await self._lock_manager.wait_for_condition(
-                node_id,
-                functools.partial(self._is_ready_to_execute, dag, node_id),
-            )
+        # The nodes are rechecked when they get a notification, so a node is started as soon as it is ready
+        # instead of waiting for the nodes that are placed before it in the topological order.
+        inbox = ConditionInbox()
+        self._lock_manager.subscribe(inbox, list_node_ids)
 
-            if dag.is_oneof and self.__has_subgraph_error(dag):
-                logger.debug('An error has been found in the %s', dag)
-                self._stop_coro_tasks(*local_tasks)
+        try:
+            to_check = list_node_ids
 
-                # We must unlock descendants because the next OneOf subgraph should start the process.
-                # Otherwise, the entire subgraph will be locked.
-                await self.__unlock_descendants(node_id=node_id, dag=dag)
-                return None
+            while True:
+                for node_id in to_check:
+                    if not self._is_ready_to_execute(dag, node_id):
+                        continue
 
-            if self._is_switch(node_id):
-                coro_to_run = self._run_switch(dag, node_id)
+                    pending.remove(node_id)
 
-            elif self._is_head_of_oneof(node_id):
-                coro_to_run = self._run_oneof(dag, node_id)
+                    if dag.is_oneof and self.__has_subgraph_error(dag):
+                        logger.debug('An error has been found in the %s', dag)
+                        self._stop_coro_tasks(*local_tasks)
 
-            else:
-                coro_to_run = self._run_node(
-                    node_id=node_id,
-                    dag=dag,
-                )
+                        # We must unlock descendants because the next OneOf subgraph should start the process.
+                        # Otherwise, the entire subgraph will be locked.
+                        await self.__unlock_descendants(node_id=node_id, dag=dag)
+                        return None
+
+                    local_tasks.append(self._create_task(self._get_node_coro(dag, node_id), name=node_id))
 
-            local_tasks.append(self._create_task(coro_to_run, name=node_id))
+                if not pending:
+                    break
+
+                to_check = sorted(pending.intersection(await inbox.wait()), key=node_order.__getitem__)
+        finally:
+            self._lock_manager.unsubscribe(inbox, list_node_ids)
 
         logger.debug('Await for result for %s the dag %s', dag.dest, dag)
 
@@ -517,6 +625,21 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
         return self._node_storage.get_node_result(dag.dest, with_hidden=True)
 
+    def _get_node_coro(self, dag: DiGraph, node_id: NodeId) -> t.Coroutine:
+        """
+        Get the coroutine that executes the node according to the node's type
+        """
+
+        node_flags = self.dag.layout.get_node_flags(node_id)
+
+        if node_flags & FLAG_IS_SWITCH:
+            return self._run_switch(dag, node_id)
+
+        if node_flags & FLAG_IS_ONEOF_HEAD:
+            return self._run_oneof(dag, node_id)
+
+        return self._run_node(node_id=node_id, dag=dag)
+
     def __has_subgraph_error(self, dag: DiGraph) -> bool:
         """
         Check if the subgraph has an error
@@ -530,7 +653,7 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
         logger.debug('Prepare OneOf DAG node_id=%s', node_id)
 
-        for idx, subgraph_node_id in enumerate(self.dag.graph.nodes[node_id][NodeField.oneof_nodes]):
+        for idx, subgraph_node_id in enumerate(self.dag.layout.oneof_candidates[node_id]):
             oneof_dag = self._get_reduced_dag(
                 source=self.dag.input_node,
                 dest=subgraph_node_id,
@@ -583,6 +706,10 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
         self._add_case_result(node_id)
 
+        # The selected branch may have been already executed by another subgraph.
+        # The switch's descendants must recheck their dependencies because they are resolved via the case result.
+        await self.__unlock_descendants(node_id=node_id, dag=dag)
+
         return await self._run_dag(
             dag=self._get_reduced_dag(
                 self.dag.input_node,
@@ -631,11 +758,7 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
                 # will be executed again and the function will unlock the descendants in the other branch.
                 to_unlock_descendants = False
 
-            logger.debug('Save the result "%s" for the node %s', result, node_id)
-            self._node_storage.set_node_result(node_id, result)
-
-            # TODO: Needs to reorganize saving policy for artifact storage
-            await self.ctx.save_node_result(node_id, result)
+            await self._save_node_result(node_id, result)
 
         finally:
             if not to_unlock_descendants:
@@ -694,13 +817,13 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
             node_result: Previous subgraph's result
         """
 
-        start_from_node_id = self.dag.graph.nodes[node_id].get(NodeField.start_node)
+        start_from_node_id = self.dag.graph.nodes[node_id].get(NF_START_NODE)
 
         if self._node_storage.exists_active_rec_subgraph(start_from_node_id, node_id):
             return
 
         self._node_storage.set_active_rec_subgraph(start_from_node_id, node_id)
-        max_iterations = self.dag.graph.nodes[node_id].get(NodeField.max_iterations)
+        max_iterations = self.dag.graph.nodes[node_id].get(NF_MAX_ITERATIONS)
 
         recurrent_subgraph = get_connected_subgraph(
             self.dag.graph,
@@ -716,7 +839,7 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
             logger.debug('Executing the %s', name)
 
             start_node = self.dag.graph.nodes[start_from_node_id]
-            start_node[NodeField.additional_data] = node_result.data
+            start_node[NF_ADDITIONAL_DATA] = node_result.data
 
             node_result = await self._run_dag(dag=recurrent_subgraph)
 
@@ -792,20 +915,30 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         for descendant_node_id in descendants:
             await self._lock_manager.unlock_condition(descendant_node_id)
 
-    def __get_descendants(self, node_id: NodeId, dag: DiGraph) -> t.Set[NodeId]:
+    def __get_descendants(self, node_id: NodeId, dag: DiGraph) -> t.List[NodeId]:
         """
-        Get all first-line the node's descendants including artificial nodes
+        Get all first-line the node's descendants including artificial nodes.
+        The descendants of switches (or of every node in a OneOf subgraph) are collected as well.
         """
 
         logger.debug('Getting descendants for the node %s', node_id)
 
-        descendants = nx.descendants_at_distance(self.dag.graph, node_id, 1)
+        layout = self.dag.layout
+        succ_bitmask = layout.succ_bitmask
+
+        descendants = pending = succ_bitmask[layout.node_index[node_id]]
+
+        while pending:
+            new_descendants = 0
+
+            for descendant_idx in iter_bits(pending):
+                if dag.is_oneof or layout.node_flags[descendant_idx] & FLAG_IS_SWITCH:
+                    new_descendants |= succ_bitmask[descendant_idx]
 
-        for descendant_node_id in set(descendants):
+            pending = new_descendants & ~descendants
+            descendants |= pending
 
-            if dag.is_oneof or self._is_switch(descendant_node_id):
-                descendants.update(self.__get_descendants(descendant_node_id, dag=dag))
-        return descendants
+        return [layout.node_ids[idx] for idx in iter_bits(descendants)]
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__} nnodes="{len(self.dag.graph.nodes)}" nedges="{len(self.dag.graph.edges)}">'
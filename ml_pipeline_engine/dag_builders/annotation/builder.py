@@ -4,20 +4,29 @@ import typing as t
 from collections import deque
 
 from ml_pipeline_engine.dag import DAG
-from ml_pipeline_engine.dag import EdgeField
-from ml_pipeline_engine.dag import NodeField
+from ml_pipeline_engine.dag import EF_CASE_BRANCH
+from ml_pipeline_engine.dag import EF_IS_SWITCH
+from ml_pipeline_engine.dag import EF_KWARG_NAME
+from ml_pipeline_engine.dag import NF_IS_ONEOF_CHILD
+from ml_pipeline_engine.dag import NF_IS_ONEOF_HEAD
+from ml_pipeline_engine.dag import NF_IS_SWITCH
+from ml_pipeline_engine.dag import NF_MAX_ITERATIONS
+from ml_pipeline_engine.dag import NF_ONEOF_NODES
+from ml_pipeline_engine.dag import NF_START_NODE
 from ml_pipeline_engine.dag.graph import DiGraph
+from ml_pipeline_engine.dag.layout import build_layout
 from ml_pipeline_engine.dag_builders.annotation import errors
 from ml_pipeline_engine.dag_builders.annotation.marks import InputGenericMark
 from ml_pipeline_engine.dag_builders.annotation.marks import InputMark
 from ml_pipeline_engine.dag_builders.annotation.marks import InputOneOfMark
 from ml_pipeline_engine.dag_builders.annotation.marks import RecurrentSubGraphMark
 from ml_pipeline_engine.dag_builders.annotation.marks import SwitchCaseMark
-from ml_pipeline_engine.node import NodeTag
+from ml_pipeline_engine.node import ExecMode
 from ml_pipeline_engine.node import NodeType
 from ml_pipeline_engine.node import generate_node_id
 from ml_pipeline_engine.node import get_callable_run_method
 from ml_pipeline_engine.node import get_node_id
+from ml_pipeline_engine.types import DAGLayoutLike
 from ml_pipeline_engine.types import DAGLike
 from ml_pipeline_engine.types import NodeBase
 from ml_pipeline_engine.types import NodeId
@@ -35,6 +44,78 @@ NodeInputSpec = t.Tuple[KwargName, t.Union[InputMark, SwitchCaseMark]]
 NodeResultT = t.TypeVar('NodeResultT')
 
 
+_NODE_CACHE_ATTR = '_annotation_builder_cache'
+
+
+def _get_cached(node: t.Any, key: str, func: t.Callable[[t.Any], t.Any]) -> t.Any:
+    """
+    Получение результата func(node), рассчитанного для текущего метода process узла.
+
+    Кеш хранится в __dict__ самого класса вместе с методом process, для которого он рассчитан, поэтому он живет
+    не дольше класса, а замена process (например, spy в тестах) приводит к повторному расчету.
+    """
+
+    process = getattr(node, 'process', None)
+    cache = vars(node).get(_NODE_CACHE_ATTR)
+
+    if cache is None or cache[0] != process:
+        cache = (process, {})
+        setattr(node, _NODE_CACHE_ATTR, cache)
+
+    results = cache[1]
+
+    if key not in results:
+        results[key] = func(node)
+
+    return results[key]
+
+
+def _check_annotations(obj: t.Any) -> None:
+    """
+    Проверка наличия аннотаций типов у переданного объекта.
+    В случае, если есть хотя бы один не типизированный параметр, будет ошибка.
+    """
+    run_method = get_callable_run_method(obj)
+
+    annotations = getattr(run_method, '__annotations__', None)
+    parameters = [
+        (name, bool(parameter.empty))
+        for name, parameter in inspect.signature(run_method).parameters.items()
+        if name not in ('self', 'args', 'kwargs')
+    ]
+
+    if not annotations and parameters:
+        raise errors.UndefinedAnnotation(f'Невозможно найти аннотации типов. obj={run_method}')
+
+    for name, is_empty in parameters:
+        if is_empty and name not in annotations:
+            raise errors.UndefinedParamAnnotation(f'Не указан тип для параметра name={name}, obj={run_method}')
+
+
+def _resolve_input_marks(node: NodeBase) -> t.Tuple[NodeInputSpec, ...]:
+    """
+    Получение меток зависимостей для входных kwarg-ов узла
+    """
+
+    run_method = get_callable_run_method(node)
+
+    inputs = []
+    for name, annotation in run_method.__annotations__.items():
+
+        if isinstance(annotation, InputGenericMark):
+            raise errors.NonRedefinedGenericTypeError(
+                f'Для использования узлов общего назначения необходимо их переопределение для целевого графа. '
+                f'param_name={name}, node={run_method}, ',
+            )
+
+        if not isinstance(annotation, (InputMark, SwitchCaseMark, InputOneOfMark, RecurrentSubGraphMark)):
+            continue
+
+        inputs.append((name, annotation))
+
+    return tuple(inputs)
+
+
 class AnnotationDAGBuilder:
     def __init__(self) -> None:
         self._dag = DiGraph(name='main-graph')
@@ -48,21 +129,7 @@ class AnnotationDAGBuilder:
         Проверка наличия аннотаций типов у переданного объекта.
         В случае, если есть хотя бы один не типизированный параметр, будет ошибка.
         """
-        run_method = get_callable_run_method(obj)
-
-        annotations = getattr(run_method, '__annotations__', None)
-        parameters = [
-            (name, bool(parameter.empty))
-            for name, parameter in inspect.signature(run_method).parameters.items()
-            if name not in ('self', 'args', 'kwargs')
-        ]
-
-        if not annotations and parameters:
-            raise errors.UndefinedAnnotation(f'Невозможно найти аннотации типов. obj={run_method}')
-
-        for name, is_empty in parameters:
-            if is_empty and name not in annotations:
-                raise errors.UndefinedParamAnnotation(f'Не указан тип для параметра name={name}, obj={run_method}')
+        _get_cached(obj, 'check_annotations', _check_annotations)
 
     @staticmethod
     def _check_base_class(node: t.Any) -> None:
@@ -87,28 +154,12 @@ class AnnotationDAGBuilder:
         self._check_annotations(node)
 
     @staticmethod
-    def _get_input_marks_map(node: NodeBase) -> t.List[NodeInputSpec]:
+    def _get_input_marks_map(node: NodeBase) -> t.Tuple[NodeInputSpec, ...]:
         """
         Получение меток зависимостей для входных kwarg-ов узла
         """
 
-        node = get_callable_run_method(node)
-
-        inputs = []
-        for name, annotation in node.__annotations__.items():
-
-            if isinstance(annotation, InputGenericMark):
-                raise errors.NonRedefinedGenericTypeError(
-                    f'Для использования узлов общего назначения необходимо их переопределение для целевого графа. '
-                    f'param_name={name}, node={node}, ',
-                )
-
-            if not isinstance(annotation, (InputMark, SwitchCaseMark, InputOneOfMark, RecurrentSubGraphMark)):
-                continue
-
-            inputs.append((name, annotation))
-
-        return inputs
+        return _get_cached(node, 'input_marks', _resolve_input_marks)
 
     def _add_node_to_map(self, node: NodeBase) -> None:
         """
@@ -132,8 +183,8 @@ class AnnotationDAGBuilder:
         Добавить в граф узел типа switch
         """
 
-        self._dag.add_node(node_id, **{NodeField.is_switch: True})
-        self._dag.add_edge(switch_decide_node_id, node_id, **{EdgeField.is_switch: True})
+        self._dag.add_node(node_id, **{NF_IS_SWITCH: True})
+        self._dag.add_edge(switch_decide_node_id, node_id, **{EF_IS_SWITCH: True})
 
     def _traverse_breadth_first_to_dag(self, input_node: NodeBase, output_node: NodeBase):  # noqa
         """
@@ -169,14 +220,14 @@ class AnnotationDAGBuilder:
                     self._dag.add_node(
                         get_node_id(input_mark.dest_node),
                         **{
-                            NodeField.start_node: get_node_id(input_mark.start_node),
-                            NodeField.max_iterations: input_mark.max_iterations,
+                            NF_START_NODE: get_node_id(input_mark.start_node),
+                            NF_MAX_ITERATIONS: input_mark.max_iterations,
                         },
                     )
                     self._add_node_pair_to_dag(
                         get_node_id(input_mark.dest_node),
                         get_node_id(current_node),
-                        **{EdgeField.kwarg_name: kwarg_name},
+                        **{EF_KWARG_NAME: kwarg_name},
                     )
                     self._recurrent_sub_graphs.append(
                         (
@@ -192,10 +243,10 @@ class AnnotationDAGBuilder:
                         get_node_id(current_node),
                     )
 
-                    node_id_list = [get_node_id(node) for node in input_mark.nodes]
+                    node_id_list = tuple(get_node_id(node) for node in input_mark.nodes)
 
                     self._dag.add_node(
-                        synthetic_node_id, **{NodeField.is_oneof_head: True, NodeField.oneof_nodes: node_id_list},
+                        synthetic_node_id, **{NF_IS_ONEOF_HEAD: True, NF_ONEOF_NODES: node_id_list},
                     )
                     self._dag.add_edge(get_node_id(input_node), synthetic_node_id)
 
@@ -203,20 +254,20 @@ class AnnotationDAGBuilder:
                         node = input_mark.nodes[node_idx]
 
                         self._add_node_to_map(node)
-                        self._dag.add_node(node_id, **{NodeField.is_oneof_child: True})
+                        self._dag.add_node(node_id, **{NF_IS_ONEOF_CHILD: True})
                         self._dag.add_edge(node_id, synthetic_node_id)
 
                         _set_visited(node)
 
                     self._synthetic_nodes.append(synthetic_node_id)
                     self._dag.add_edge(
-                        synthetic_node_id, get_node_id(current_node), **{EdgeField.kwarg_name: kwarg_name},
+                        synthetic_node_id, get_node_id(current_node), **{EF_KWARG_NAME: kwarg_name},
                     )
 
                 if isinstance(input_mark, InputMark):
                     self._add_node_to_map(input_mark.node)
                     self._add_node_pair_to_dag(
-                        get_node_id(input_mark.node), get_node_id(current_node), **{EdgeField.kwarg_name: kwarg_name},
+                        get_node_id(input_mark.node), get_node_id(current_node), **{EF_KWARG_NAME: kwarg_name},
                     )
                     _set_visited(input_mark.node)
 
@@ -231,11 +282,11 @@ class AnnotationDAGBuilder:
                     for case_branch, case_node in input_mark.cases:
                         self._add_node_to_map(case_node)
                         self._dag.add_edge(
-                            get_node_id(case_node), switch_node_id, **{EdgeField.case_branch: case_branch},
+                            get_node_id(case_node), switch_node_id, **{EF_CASE_BRANCH: case_branch},
                         )
                         _set_visited(case_node)
 
-                    self._dag.add_edge(switch_node_id, get_node_id(current_node), **{EdgeField.kwarg_name: kwarg_name})
+                    self._dag.add_edge(switch_node_id, get_node_id(current_node), **{EF_KWARG_NAME: kwarg_name})
                     self._synthetic_nodes.append(switch_node_id)
 
     def _validate_recurrent_node_base_classes(self) -> None:
@@ -277,25 +328,26 @@ class AnnotationDAGBuilder:
         self._validate_recurrent_node_base_classes()
         self._validate_recurrent_nodes_params()
 
-    def _is_executor_needed(self) -> t.Tuple[bool, bool]:
+    @staticmethod
+    def _is_executor_needed(layout: DAGLayoutLike) -> t.Tuple[bool, bool]:
         """
-        Проверяем надобность пулов для узлов
+        Проверяем надобность пулов для узлов по предрасчитанным способам исполнения.
+        Синхронные узлы с тегом non_async исполняются в цикле событий и пул потоков не требуют
         """
 
-        is_thread_pool_needed = False
-        is_process_pool_needed = False
-
-        for node in self._node_map.values():
+        return ExecMode.process in layout.exec_modes, ExecMode.thread in layout.exec_modes
 
-            if inspect.iscoroutinefunction(get_callable_run_method(node)):
-                continue
-
-            if NodeTag.process in node.tags:
-                is_process_pool_needed = True
-            else:
-                is_thread_pool_needed = True
+    def _is_linear(self, layout: DAGLayoutLike) -> bool:
+        """
+        Проверка, что граф является цепочкой узлов без switch, oneof и рекуррентных подграфов
+        """
 
-        return is_process_pool_needed, is_thread_pool_needed
+        return (
+            bool(layout.layers)
+            and all(len(layer) == 1 for layer in layout.layers)
+            and not self._synthetic_nodes
+            and not self._recurrent_sub_graphs
+        )
 
     def build(self, input_node: NodeBase, output_node: NodeBase = None) -> DAGLike:
         """
@@ -312,13 +364,17 @@ class AnnotationDAGBuilder:
 
         self._validate_graph()
 
-        is_process_pool_needed, is_thread_pool_needed = self._is_executor_needed()
+        graph = self._dag.copy()
+        layout = build_layout(graph, self._node_map)
+        is_process_pool_needed, is_thread_pool_needed = self._is_executor_needed(layout)
 
         return DAG(
-            graph=self._dag.copy(),
+            graph=graph,
             input_node=get_node_id(input_node),
             output_node=get_node_id(output_node),
             node_map=copy.deepcopy(self._node_map),
+            layout=layout,
+            is_linear=self._is_linear(layout),
             is_process_pool_needed=is_process_pool_needed,
             is_thread_pool_needed=is_thread_pool_needed,
         )
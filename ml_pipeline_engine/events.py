@@ -1,12 +1,16 @@
+import time
 import typing as t
 
 from ml_pipeline_engine.types import EventManagerLike
+from ml_pipeline_engine.types import NodeEvent
 from ml_pipeline_engine.types import NodeId
 from ml_pipeline_engine.types import PipelineResult
 
 
 class EventSourceMixin:
     _get_event_managers: t.Callable[..., t.List[t.Type[EventManagerLike]]]
+    # The list is created on the first stored event, so subclasses don't have to initialize it
+    _node_events: t.Optional[t.List[NodeEvent]] = None
 
     async def _emit(self, event_name: str, **kwargs: t.Any) -> None:
         for mgr in self._get_event_managers():
@@ -15,14 +19,59 @@ class EventSourceMixin:
             if callback:
                 await callback(ctx=self, **kwargs)
 
+    async def _emit_node_event(self, event_name: str, node_id: NodeId, **kwargs: t.Any) -> None:
+        """
+        Emit the node event to regular managers and store it for the batched ones
+        """
+
+        has_batched = False
+
+        for mgr in self._get_event_managers():
+            if getattr(mgr, 'batched', False):
+                has_batched = True
+                continue
+
+            callback = getattr(mgr, event_name, None)
+
+            if callback:
+                await callback(ctx=self, node_id=node_id, **kwargs)
+
+        if has_batched:
+            if self._node_events is None:
+                self._node_events = []
+
+            self._node_events.append(
+                NodeEvent(name=event_name, node_id=node_id, error=kwargs.get('error'), timestamp=time.time()),
+            )
+
+    async def _flush_node_events(self) -> None:
+        """
+        Send the accumulated node events to the batched managers
+        """
+
+        if not self._node_events:
+            return
+
+        events, self._node_events = self._node_events, []
+
+        for mgr in self._get_event_managers():
+            if not getattr(mgr, 'batched', False):
+                continue
+
+            callback = getattr(mgr, 'on_node_events_batch', None)
+
+            if callback:
+                await callback(ctx=self, events=events)
+
     async def emit_on_node_start(self, node_id: NodeId) -> None:
-        await self._emit('on_node_start', node_id=node_id)
+        await self._emit_node_event('on_node_start', node_id=node_id)
 
     async def emit_on_node_complete(self, node_id: NodeId, error: t.Optional[Exception]) -> None:
-        await self._emit('on_node_complete', node_id=node_id, error=error)
+        await self._emit_node_event('on_node_complete', node_id=node_id, error=error)
 
     async def emit_on_pipeline_start(self) -> None:
         await self._emit('on_pipeline_start')
 
     async def emit_on_pipeline_complete(self, result: PipelineResult) -> None:
+        await self._flush_node_events()
         await self._emit('on_pipeline_complete', result=result)
@@ -30,3 +30,14 @@ class NodeTag(str, enum.Enum):
     process = 'process'
     thread = 'thread'
     non_async = 'non_async'
+
+
+class ExecMode(enum.IntEnum):
+    """
+    Способ исполнения метода process узла, определяется по тегам узла при сборке графа
+    """
+
+    coroutine = 0
+    inline = 1
+    thread = 2
+    process = 3
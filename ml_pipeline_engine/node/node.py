@@ -1,11 +1,13 @@
 import asyncio
 import functools
 import inspect
+import sys
 import typing as t
 import uuid
 
 from ml_pipeline_engine.logs import logger_node as logger
 from ml_pipeline_engine.module_loading import get_instance
+from ml_pipeline_engine.node.enums import ExecMode
 from ml_pipeline_engine.node.enums import NodeTag
 from ml_pipeline_engine.node.errors import ClassExpectedError
 from ml_pipeline_engine.node.errors import RunMethodExpectedError
@@ -22,7 +24,7 @@ def generate_pipeline_id() -> uuid.UUID:
 
 
 def generate_node_id(prefix: str, name: t.Optional[str] = None) -> str:
-    return f'{prefix}__{name if name is not None else uuid.uuid4().hex[-8:]}'
+    return sys.intern(f'{prefix}__{name if name is not None else uuid.uuid4().hex[-8:]}')
 
 
 def get_node_id(node: NodeBase) -> NodeId:
@@ -33,7 +35,8 @@ def get_node_id(node: NodeBase) -> NodeId:
     else:
         node_name = f'{node.__module__}_{getattr(node, "__name__", node.__class__.__name__)}'.replace('.', '_')
 
-    return '__'.join([node_type, node_name])
+    # Node ids are used as keys of many dicts, interned strings are compared by identity
+    return sys.intern('__'.join([node_type, node_name]))
 
 
 def get_callable_run_method(node: NodeBase) -> t.Callable:
@@ -51,27 +54,60 @@ def run_node_default(node: NodeBase[NodeResultT], **kwargs: t.Any) -> t.Type[Nod
     return get_instance(node).get_default(**kwargs)
 
 
+def get_exec_mode(node: NodeBase) -> ExecMode:
+    """
+    Get the way the node's run method is executed according to the node's tags
+    """
+
+    if inspect.iscoroutinefunction(get_callable_run_method(node)):
+        return ExecMode.coroutine
+
+    tags = node.tags or ()
+
+    if NodeTag.non_async in tags:
+        return ExecMode.inline
+
+    if NodeTag.process in tags:
+        return ExecMode.process
+
+    return ExecMode.thread
+
+
 async def run_node(node: NodeBase[NodeResultT], *args: t.Any, node_id: NodeId, **kwargs: t.Any) -> t.Type[NodeResultT]:
     """
     Run a node in a specific way according to the node's tags
     """
 
+    return await run_node_in_mode(node, get_exec_mode(node), args, kwargs, node_id=node_id)
+
+
+async def run_node_in_mode(
+    node: NodeBase[NodeResultT],
+    exec_mode: ExecMode,
+    args: t.Tuple[t.Any, ...],
+    kwargs: t.Dict[str, t.Any],
+    node_id: NodeId,
+) -> t.Type[NodeResultT]:
+    """
+    Run a node in the precomputed execution mode (see get_exec_mode).
+    The node's arguments are passed as a tuple and a dict, so their names can't clash with the function's parameters.
+    """
+
     run_method = get_callable_run_method(node)
-    loop = asyncio.get_running_loop()
-    tags = node.tags or ()
 
-    if inspect.iscoroutinefunction(run_method):
+    if exec_mode == ExecMode.coroutine:
         logger.debug('The node will be executed as coroutine function in the loop, node_id=%s', node_id)
         result = await run_method(*args, **kwargs)
 
-    elif NodeTag.non_async in tags:
+    elif exec_mode == ExecMode.inline:
         logger.debug('The node will be executed as sync function, node_id=%s', node_id)
         result = run_method(*args, **kwargs)
 
     else:
+        loop = asyncio.get_running_loop()
         executor = (
             process_pool_registry.get_pool_executor()
-            if NodeTag.process in tags
+            if exec_mode == ExecMode.process
             else threads_pool_registry.get_pool_executor()
         )
 
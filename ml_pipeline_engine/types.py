@@ -1,5 +1,7 @@
 import abc
+import sys
 import typing as t
+from array import array
 from dataclasses import dataclass
 from uuid import UUID
 
@@ -16,6 +18,9 @@ CaseLabel = str
 SerializationNodeKind = str
 NodeTag = str
 
+# dataclass(slots=True) is available since Python 3.10
+DATACLASS_SLOTS: t.Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class RetryProtocol(t.Protocol):
     """
@@ -40,7 +45,7 @@ class TagProtocol(t.Protocol):
     tags: t.ClassVar[t.Tuple[NodeTag, ...]] = ()
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Recurrent:
     data: t.Optional[AdditionalDataT]
 
@@ -71,7 +76,7 @@ class NodeBase(RetryProtocol, TagProtocol, t.Protocol[NodeResultT]):
     ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PipelineResult(t.Generic[NodeResultT]):
     """
     Контейнер результата выполнения пайплайна.
@@ -86,7 +91,7 @@ class PipelineResult(t.Generic[NodeResultT]):
             raise self.error
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class CaseResult:
     """
     Результат оператора switch-case
@@ -147,6 +152,9 @@ class PipelineContextLike(t.Protocol):
     async def save_node_result(self, node_id: NodeId, data: t.Any) -> None:
         ...
 
+    async def flush_node_results(self) -> None:
+        ...
+
     @property
     def model_name(self) -> ModelName:
         ...
@@ -155,11 +163,28 @@ class PipelineContextLike(t.Protocol):
         ...
 
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class NodeEvent:
+    """
+    Событие жизненного цикла узла, накопленное для батчевой отправки
+    """
+
+    name: str
+    node_id: NodeId
+    error: t.Optional[Exception]
+    timestamp: float
+
+
 class EventManagerLike(t.Protocol):
     """
     Менеджер событий жизненного цикла пайплайна
+
+    Если batched = True, события узлов не отправляются по одному, а накапливаются в контексте и передаются
+    одним вызовом on_node_events_batch перед on_pipeline_complete.
     """
 
+    batched: t.ClassVar[bool] = False
+
     async def on_pipeline_start(self, ctx: PipelineContextLike) -> None:
         ...
 
@@ -172,6 +197,9 @@ class EventManagerLike(t.Protocol):
     async def on_node_complete(self, ctx: PipelineContextLike, node_id: NodeId, error: t.Optional[Exception]) -> None:
         ...
 
+    async def on_node_events_batch(self, ctx: PipelineContextLike, events: t.List[NodeEvent]) -> None:
+        ...
+
 
 class ArtifactStoreLike(t.Protocol):
     """
@@ -187,6 +215,9 @@ class ArtifactStoreLike(t.Protocol):
     async def load(self, node_id: NodeId) -> NodeResultT:
         ...
 
+    async def flush(self) -> None:
+        ...
+
 
 class RetryPolicyLike(t.Protocol):
     node: NodeBase
@@ -220,6 +251,34 @@ class DAGRunManagerLike(t.Protocol):
         ...
 
 
+class DAGLayoutLike(t.Protocol):
+    """
+    Плоское представление структуры графа
+    """
+
+    node_ids: t.Tuple[NodeId, ...]
+    node_index: t.Dict[NodeId, int]
+    pred_offsets: array
+    pred_nodes: array
+    pred_case_branch: t.Tuple[t.Optional[CaseLabel], ...]
+    pred_is_switch: bytes
+    node_flags: bytes
+    oneof_candidates: t.Dict[NodeId, t.Tuple[NodeId, ...]]
+    kwarg_layout: t.Tuple[t.Tuple[t.Tuple[str, NodeId, bool], ...], ...]
+    succ_bitmask: t.Tuple[int, ...]
+    layers: t.Tuple[t.Tuple[int, ...], ...]
+    exec_modes: bytes
+
+    def get_node_flags(self, node_id: NodeId) -> int:
+        ...
+
+    def get_pred_range(self, node_idx: int) -> range:
+        ...
+
+    def get_pred_ids(self, node_id: NodeId) -> t.List[NodeId]:
+        ...
+
+
 class DAGLike(t.Protocol[NodeResultT]):
     """
     Граф
@@ -229,10 +288,12 @@ class DAGLike(t.Protocol[NodeResultT]):
     input_node: NodeId
     output_node: NodeId
     node_map: t.Dict[NodeId, NodeBase]
+    layout: DAGLayoutLike
     run_manager: DAGRunManagerLike
     retry_policy: RetryPolicyLike
     is_process_pool_needed: bool
     is_thread_pool_needed: bool
+    is_linear: bool
 
     @abc.abstractmethod
     async def run(self, ctx: PipelineContextLike) -> NodeResultT:
@@ -0,0 +1,186 @@
+import asyncio
+import typing as t
+
+import pytest
+
+from ml_pipeline_engine.artifact_store.store.base import ArtifactStore
+from ml_pipeline_engine.artifact_store.store.buffered import BufferedArtifactStore
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.types import NodeId
+from ml_pipeline_engine.types import PipelineContextLike
+
+
+class InMemoryArtifactStore(BufferedArtifactStore):
+    batches: t.ClassVar[t.List[t.Dict[NodeId, t.Any]]] = []
+
+    async def save_batch(self, items: t.Dict[NodeId, t.Any]) -> None:
+        self.batches.append(items)
+
+    async def load_saved(self, node_id: NodeId) -> t.Any:
+        for batch in reversed(self.batches):
+            if node_id in batch:
+                return batch[node_id]
+
+        raise KeyError(node_id)
+
+
+@pytest.fixture
+def store() -> InMemoryArtifactStore:
+    InMemoryArtifactStore.batches = []
+    return InMemoryArtifactStore(ctx=t.cast(PipelineContextLike, None))
+
+
+async def test_buffered_artifact_store_flush(store: InMemoryArtifactStore) -> None:
+    await store.save('some-node-id-1', 1)
+    await store.save('some-node-id-2', 2)
+
+    assert await store.load('some-node-id-1') == 1
+    assert store.batches == []
+
+    await store.flush()
+    await store.flush()
+
+    assert store.batches == [{'some-node-id-1': 1, 'some-node-id-2': 2}]
+    assert await store.load('some-node-id-2') == 2
+
+
+def start_delayed_flush(store: BufferedArtifactStore) -> None:
+    assert store._flush_handle is not None
+
+    store._flush_handle.cancel()
+    store._start_flush()
+
+
+async def test_buffered_artifact_store_delayed_flush(store: InMemoryArtifactStore) -> None:
+    await store.save('some-node-id-1', 1)
+    await store.save('some-node-id-2', 2)
+
+    start_delayed_flush(store)
+    await store._flush_task
+
+    assert store.batches == [{'some-node-id-1': 1, 'some-node-id-2': 2}]
+
+    await store.save('some-node-id-3', 3)
+    await store.flush()
+
+    assert store.batches[1:] == [{'some-node-id-3': 3}]
+
+
+async def test_buffered_artifact_store_flush_during_delayed_flush() -> None:
+    is_released = asyncio.Event()
+    n_saving = 0
+    max_n_saving = 0
+
+    class SlowArtifactStore(InMemoryArtifactStore):
+        async def save_batch(self, items: t.Dict[NodeId, t.Any]) -> None:
+            nonlocal n_saving, max_n_saving
+
+            n_saving += 1
+            max_n_saving = max(max_n_saving, n_saving)
+            await is_released.wait()
+            n_saving -= 1
+
+            await super().save_batch(items)
+
+    InMemoryArtifactStore.batches = []
+    store = SlowArtifactStore(ctx=t.cast(PipelineContextLike, None))
+
+    await store.save('some-node-id-1', 1)
+    start_delayed_flush(store)
+
+    flush = asyncio.ensure_future(store.flush())
+    await asyncio.sleep(0)
+
+    # The first batch is still being saved, so the next delayed flush must not start a concurrent write
+    await store.save('some-node-id-2', 2)
+    start_delayed_flush(store)
+
+    is_released.set()
+    await flush
+
+    assert max_n_saving == 1
+    assert store.batches == [{'some-node-id-1': 1}, {'some-node-id-2': 2}]
+
+
+async def test_buffered_artifact_store_pipeline(store: InMemoryArtifactStore, model_name_op: str) -> None:
+    class SomeDataSourceNode(ProcessorBase):
+        name = 'some_datasource'
+
+        def process(self, x: int) -> int:
+            return x * -1
+
+    class SomeOutputNode(ProcessorBase):
+        name = 'some_output'
+
+        def process(self, num: Input(SomeDataSourceNode)) -> float:
+            return num * 2.0
+
+    some_model_pipeline = PipelineChart(
+        model_name=model_name_op,
+        entrypoint=build_dag(input_node=SomeDataSourceNode, output_node=SomeOutputNode),
+        artifact_store=InMemoryArtifactStore,
+    )
+
+    result = await some_model_pipeline.run(input_kwargs=dict(x=2))
+
+    assert result.value == -4.0
+    assert store.batches == [{'processor__some_datasource': -2, 'processor__some_output': -4.0}]
+
+
+async def test_buffered_artifact_store_pipeline_error(store: InMemoryArtifactStore, model_name_op: str) -> None:
+    class SomeDataSourceNode(ProcessorBase):
+        name = 'some_datasource'
+
+        def process(self, x: int) -> int:
+            return x * -1
+
+    class SomeOutputNode(ProcessorBase):
+        name = 'some_output'
+
+        def process(self, num: Input(SomeDataSourceNode)) -> float:
+            return num / 0
+
+    some_model_pipeline = PipelineChart(
+        model_name=model_name_op,
+        entrypoint=build_dag(input_node=SomeDataSourceNode, output_node=SomeOutputNode),
+        artifact_store=InMemoryArtifactStore,
+    )
+
+    result = await some_model_pipeline.run(input_kwargs=dict(x=2))
+
+    assert isinstance(result.error, ZeroDivisionError)
+    assert store.batches == [{'processor__some_datasource': -2}]
+
+
+async def test_flush_of_other_stores(model_name_op: str) -> None:
+    flushed = []
+
+    class SomeStore(ArtifactStore):
+        async def save(self, node_id: NodeId, data: t.Any) -> None: ...
+
+        async def load(self, node_id: NodeId) -> t.Any: ...
+
+        async def flush(self) -> None:
+            flushed.append(self.ctx.pipeline_id)
+
+    class SomeNode(ProcessorBase):
+        def process(self, x: int) -> int:
+            return x
+
+    class SomeOutputNode(ProcessorBase):
+        def process(self, num: Input(SomeNode)) -> int:
+            return num
+
+    some_model_pipeline = PipelineChart(
+        model_name=model_name_op,
+        entrypoint=build_dag(input_node=SomeNode, output_node=SomeOutputNode),
+        artifact_store=SomeStore,
+    )
+
+    result = await some_model_pipeline.run(input_kwargs=dict(x=2))
+
+    assert result.value == 2
+    assert flushed == [result.pipeline_id]
@@ -1,3 +1,4 @@
+import asyncio
 import typing as t
 
 import pytest_mock
@@ -57,3 +58,23 @@ async def test_dag_retry__error(
 
     assert external_func_patch.call_count == 3
     assert collect_spy.call_count == 3
+
+
+async def test_dag_retry__error_without_delay(
+    build_chart: t.Callable[..., PipelineChartLike],
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    delay = mocker.patch(
+        'ml_pipeline_engine.dag.NodeRetryPolicy.delay',
+        return_value=0,
+        new_callable=mocker.PropertyMock,
+    )
+    sleep_spy = mocker.spy(asyncio, 'sleep')
+    mocker.patch.object(ExternalDatasource, 'external_func', side_effect=[Exception, Exception, 0.5])
+
+    chart = build_chart(input_node=InvertNumber, output_node=DoubleNumber)
+    result = await chart.run(input_kwargs=dict(num=2.5))
+
+    assert result.value == -4.0
+    assert delay.call_count == 4
+    sleep_spy.assert_not_called()
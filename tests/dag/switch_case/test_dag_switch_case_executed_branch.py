@@ -0,0 +1,44 @@
+import asyncio
+import typing as t
+
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.dag_builders.annotation.marks import SwitchCase
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.types import PipelineChartLike
+
+
+class Ident(ProcessorBase):
+    def process(self, num: float) -> float:
+        return num
+
+
+class Invert(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        return -num
+
+
+class SwitchNode(ProcessorBase):
+    def process(self, num: Input(Ident)) -> str:
+        return 'ident' if num >= 0 else 'invert'
+
+
+class CaseNode(ProcessorBase):
+    def process(self, num: SwitchCase(switch=SwitchNode, cases=[('invert', Invert), ('ident', Ident)])) -> float:
+        return num
+
+
+class Out(ProcessorBase):
+    def process(self, num: Input(CaseNode), num2: Input(Invert)) -> float:
+        return num + num2
+
+
+async def test_dag_switch_case_executed_branch(
+    build_chart: t.Callable[..., PipelineChartLike],
+) -> None:
+    # The selected branch (the input node) has been executed before the switch chose it,
+    # so the switch's descendants must be notified by the switch itself.
+    chart = build_chart(input_node=Ident, output_node=Out)
+    result = await asyncio.wait_for(chart.run(input_kwargs=dict(num=2.0)), timeout=5)
+
+    assert result.value == 0.0
+    assert result.error is None
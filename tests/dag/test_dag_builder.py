@@ -0,0 +1,93 @@
+import gc
+import typing as t
+import weakref
+
+import pytest
+import pytest_mock
+
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation import builder as annotation_builder
+from ml_pipeline_engine.dag_builders.annotation.builder import AnnotationDAGBuilder
+from ml_pipeline_engine.dag_builders.annotation.errors import UndefinedParamAnnotation
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import ProcessorBase
+
+
+def test_build_dag_resolves_annotations_once(mocker: pytest_mock.MockerFixture) -> None:
+    class SomeInput(ProcessorBase):
+        def process(self, x: int) -> int:
+            return x
+
+    class SomeOutput(ProcessorBase):
+        def process(self, x: Input(SomeInput)) -> int:
+            return x
+
+    check_annotations_spy = mocker.spy(annotation_builder, '_check_annotations')
+
+    build_dag(input_node=SomeInput, output_node=SomeOutput)
+    build_dag(input_node=SomeInput, output_node=SomeOutput)
+
+    # The annotations of every node class are checked once, the second build uses the cached result
+    assert {call.args[0] for call in check_annotations_spy.call_args_list} == {SomeInput, SomeOutput}
+    assert check_annotations_spy.call_count == 2
+
+
+def test_build_dag_annotation_cache_follows_process() -> None:
+    class SomeInput(ProcessorBase):
+        def process(self, x: int) -> int:
+            return x
+
+    class OtherInput(ProcessorBase):
+        def process(self, x: int) -> int:
+            return x
+
+    class SomeOutput(ProcessorBase):
+        def process(self, x: Input(SomeInput)) -> int:
+            return x
+
+    ((_, mark),) = AnnotationDAGBuilder._get_input_marks_map(SomeOutput)
+    assert mark.node is SomeInput
+
+    def process(self: t.Any, x: Input(OtherInput)) -> int:
+        return x
+
+    SomeOutput.process = process
+
+    ((_, mark),) = AnnotationDAGBuilder._get_input_marks_map(SomeOutput)
+    assert mark.node is OtherInput
+
+
+def test_build_dag_annotation_cache_does_not_keep_nodes() -> None:
+    class SomeInput(ProcessorBase):
+        def process(self, x: int) -> int:
+            return x
+
+    class SomeOutput(ProcessorBase):
+        def process(self, x: Input(SomeInput)) -> int:
+            return x
+
+    build_dag(input_node=SomeInput, output_node=SomeOutput)
+
+    node_ref = weakref.ref(SomeOutput)
+    del SomeOutput
+    gc.collect()
+
+    assert node_ref() is None
+
+
+def test_build_dag_checks_replaced_process() -> None:
+    class SomeInput(ProcessorBase):
+        def process(self, x: int) -> int:
+            return x
+
+    class SomeOutput(ProcessorBase):
+        def process(self, x: Input(SomeInput)) -> int:
+            return x
+
+    def process(self: t.Any, x: Input(SomeInput), y) -> int:  # noqa: ANN001
+        return x + y
+
+    SomeOutput.process = process
+
+    with pytest.raises(UndefinedParamAnnotation):
+        build_dag(input_node=SomeInput, output_node=SomeOutput)
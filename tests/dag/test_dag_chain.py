@@ -1,5 +1,7 @@
 import typing as t
 
+import networkx as nx
+
 from ml_pipeline_engine.dag_builders.annotation.marks import Input
 from ml_pipeline_engine.node import ProcessorBase
 from ml_pipeline_engine.types import PipelineChartLike
@@ -28,3 +30,39 @@ async def test_dag_chain(
 
     assert result.value == -4.8
     assert result.error is None
+
+
+async def test_dag_chain_is_linear(
+    build_chart: t.Callable[..., PipelineChartLike],
+) -> None:
+    chart = build_chart(input_node=InvertNumber, output_node=DoubleNumber)
+
+    assert chart.entrypoint.is_linear is True
+
+
+async def test_dag_chain_same_input_and_output(
+    build_chart: t.Callable[..., PipelineChartLike],
+) -> None:
+    chart = build_chart(input_node=InvertNumber, output_node=InvertNumber)
+    result = await chart.run(input_kwargs=dict(num=2.5))
+
+    assert chart.entrypoint.is_linear is False
+    assert isinstance(result.error, nx.NodeNotFound)
+
+
+async def test_dag_chain_node_kwarg_named_exec_mode(
+    build_chart: t.Callable[..., PipelineChartLike],
+) -> None:
+    class Mode(ProcessorBase):
+        def process(self, mode: str) -> str:
+            return mode.upper()
+
+    class UseMode(ProcessorBase):
+        async def process(self, exec_mode: Input(Mode)) -> str:
+            return exec_mode
+
+    chart = build_chart(input_node=Mode, output_node=UseMode)
+    result = await chart.run(input_kwargs=dict(mode='fast'))
+
+    assert result.error is None
+    assert result.value == 'FAST'
@@ -0,0 +1,151 @@
+import networkx as nx
+import pytest
+
+from ml_pipeline_engine.dag import FLAG_IS_ONEOF_HEAD
+from ml_pipeline_engine.dag import FLAG_IS_RECURRENT
+from ml_pipeline_engine.dag import FLAG_IS_SWITCH
+from ml_pipeline_engine.dag import build_layout
+from ml_pipeline_engine.dag import iter_bits
+from ml_pipeline_engine.dag.errors import DAGCycleError
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.dag_builders.annotation.marks import InputOneOf
+from ml_pipeline_engine.dag_builders.annotation.marks import SwitchCase
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import RecurrentProcessor
+from ml_pipeline_engine.node import get_node_id
+
+
+class Ident(ProcessorBase):
+    def process(self, num: float) -> float:
+        return num
+
+
+class SwitchNode(ProcessorBase):
+    def process(self, num: Input(Ident)) -> str:
+        return 'double' if num > 0 else 'invert'
+
+
+class DoubleNumber(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        return num * 2
+
+
+class InvertNumber(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        return -num
+
+
+class RecurrentNumber(RecurrentProcessor):
+    def process(self, num: Input(Ident)) -> float:
+        return num
+
+
+class RecurrentOut(ProcessorBase):
+    def process(self, num: InputOneOf([RecurrentNumber, DoubleNumber])) -> float:
+        return num
+
+
+class Out(ProcessorBase):
+    def process(
+        self,
+        num: SwitchCase(
+            switch=SwitchNode,
+            cases=[('double', DoubleNumber), ('invert', InvertNumber)],
+            name='some_switch',
+        ),
+        fallback: InputOneOf([DoubleNumber, InvertNumber]),
+    ) -> float:
+        return num + fallback
+
+
+def test_dag_layout() -> None:
+    dag = build_dag(input_node=Ident, output_node=Out)
+    layout = dag.layout
+
+    assert layout.node_ids == tuple(dag.graph.nodes)
+    assert all(layout.node_index[node_id] == idx for idx, node_id in enumerate(layout.node_ids))
+
+    for node_id, node_idx in layout.node_index.items():
+        preds = [layout.node_ids[layout.pred_nodes[pos]] for pos in layout.get_pred_range(node_idx)]
+        assert sorted(preds) == sorted(dag.graph.predecessors(node_id))
+        assert layout.get_pred_ids(node_id) == preds
+
+    out_idx = layout.node_index[get_node_id(Out)]
+    assert sorted(kwarg_name for kwarg_name, _, _ in layout.kwarg_layout[out_idx]) == ['fallback', 'num']
+
+    (num_layout,) = (kwarg for kwarg in layout.kwarg_layout[out_idx] if kwarg[0] == 'num')
+    assert num_layout == ('num', 'switch__some_switch', True)
+    assert layout.kwarg_layout[layout.node_index[get_node_id(SwitchNode)]] == (('num', get_node_id(Ident), False),)
+
+    switch_idx = layout.node_index['switch__some_switch']
+    assert sorted(str(layout.pred_case_branch[pos]) for pos in layout.get_pred_range(switch_idx)) == [
+        'None',
+        'double',
+        'invert',
+    ]
+    switch_deciders = [
+        layout.node_ids[layout.pred_nodes[pos]]
+        for pos in layout.get_pred_range(switch_idx)
+        if layout.pred_is_switch[pos]
+    ]
+    assert switch_deciders == [get_node_id(SwitchNode)]
+    assert len(layout.pred_is_switch) == len(layout.pred_nodes)
+
+    flagged = {
+        flag: {node_id for node_id in layout.node_ids if layout.get_node_flags(node_id) & flag}
+        for flag in (
+            FLAG_IS_SWITCH,
+            FLAG_IS_ONEOF_HEAD,
+            FLAG_IS_RECURRENT,
+        )
+    }
+
+    assert flagged[FLAG_IS_SWITCH] == {'switch__some_switch'}
+    assert len(flagged[FLAG_IS_ONEOF_HEAD]) == 1
+    assert flagged[FLAG_IS_RECURRENT] == set()
+
+    assert layout.get_node_flags('unknown') == 0
+
+    for node_id, node_idx in layout.node_index.items():
+        succs = [layout.node_ids[succ_idx] for succ_idx in iter_bits(layout.succ_bitmask[node_idx])]
+        assert sorted(succs) == sorted(dag.graph.successors(node_id))
+
+
+def test_dag_layout_oneof_candidates() -> None:
+    layout = build_dag(input_node=Ident, output_node=Out).layout
+
+    (candidates,) = layout.oneof_candidates.values()
+    assert candidates == (get_node_id(DoubleNumber), get_node_id(InvertNumber))
+
+
+def test_dag_layout_recurrent_flag() -> None:
+    layout = build_dag(input_node=Ident, output_node=RecurrentOut).layout
+
+    (oneof_head,) = layout.oneof_candidates
+    assert {node_id for node_id in layout.node_ids if layout.get_node_flags(node_id) & FLAG_IS_RECURRENT} == {
+        get_node_id(RecurrentNumber),
+        oneof_head,
+    }
+
+
+def test_iter_bits() -> None:
+    assert list(iter_bits(0)) == []
+    assert list(iter_bits(0b101001)) == [0, 3, 5]
+    assert list(iter_bits(1 << 100)) == [100]
+
+
+def test_dag_layout_layers() -> None:
+    dag = build_dag(input_node=Ident, output_node=Out)
+    layout = dag.layout
+
+    assert [[layout.node_ids[idx] for idx in layer] for layer in layout.layers] == [
+        list(layer) for layer in nx.topological_generations(dag.graph)
+    ]
+
+
+def test_dag_layout_cycle() -> None:
+    graph = nx.DiGraph([('a', 'b'), ('b', 'c'), ('c', 'a')])
+
+    with pytest.raises(DAGCycleError):
+        build_layout(graph, {})
@@ -1,7 +1,15 @@
+import asyncio
+import sys
 import typing as t
 
+import pytest
+import pytest_mock
+
+from ml_pipeline_engine.dag import DAGRunConcurrentManager
+from ml_pipeline_engine.dag_builders.annotation import build_dag
 from ml_pipeline_engine.dag_builders.annotation.marks import Input
 from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import get_node_id
 from ml_pipeline_engine.types import PipelineChartLike
 
 
@@ -32,3 +40,65 @@ async def test_dag_rhombus(
     result = await chart.run(input_kwargs=dict(num=3.0))
 
     assert result.value == -8.8
+
+
+async def test_dag_rhombus_readiness_error(
+    build_chart: t.Callable[..., PipelineChartLike],
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    is_ready_to_execute = DAGRunConcurrentManager._is_ready_to_execute
+
+    def _is_ready_to_execute(self: DAGRunConcurrentManager, dag: t.Any, node_id: str) -> bool:
+        if node_id == get_node_id(AddNumbers):
+            raise ValueError('readiness check failed')
+
+        return is_ready_to_execute(self, dag, node_id)
+
+    mocker.patch.object(DAGRunConcurrentManager, '_is_ready_to_execute', _is_ready_to_execute)
+    chart = build_chart(input_node=InvertNumber, output_node=AddNumbers)
+    add_numbers = mocker.spy(AddNumbers, 'process')
+
+    result = await chart.run(input_kwargs=dict(num=3.0))
+
+    assert isinstance(result.error, ValueError)
+    assert result.error.args == ('readiness check failed',)
+    add_numbers.assert_not_called()
+
+
+def test_dag_rhombus_topology() -> None:
+    dag = build_dag(input_node=InvertNumber, output_node=AddNumbers)
+
+    invert, add_const, double, add_numbers = map(get_node_id, (InvertNumber, AddConst, DoubleNumber, AddNumbers))
+
+    layers = [{dag.layout.node_ids[node_idx] for node_idx in layer} for layer in dag.layout.layers]
+    assert layers == [{invert}, {add_const, double}, {add_numbers}]
+
+    assert set(dag.layout.get_pred_ids(add_numbers)) == {add_const, double}
+    assert dag.layout.get_pred_ids(invert) == []
+    assert dag.is_linear is False
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason='asyncio.eager_task_factory requires Python 3.12+')
+async def test_dag_rhombus_eager_main_task(
+    mocker: pytest_mock.MockerFixture,
+    build_chart: t.Callable[..., PipelineChartLike],
+) -> None:
+    create_task = mocker.spy(asyncio, 'create_task')
+    tasks_created_eagerly = []
+
+    def eager_task_factory(*args: t.Any, **kwargs: t.Any) -> asyncio.Task:
+        n_tasks = create_task.call_count
+        task = asyncio.eager_task_factory(*args, **kwargs)
+        tasks_created_eagerly.append(create_task.call_count - n_tasks)
+        return task
+
+    mocker.patch('ml_pipeline_engine.dag.manager._eager_task_factory', eager_task_factory)
+
+    chart = build_chart(input_node=InvertNumber, output_node=AddNumbers)
+    result = await chart.run(input_kwargs=dict(num=3.0))
+
+    assert result.value == -8.8
+    # The main task dispatches the input node before the factory returns, other tasks are created as usual
+    assert tasks_created_eagerly == [1]
+    assert create_task.call_count > 1
+    assert 'run' not in {call.kwargs['name'] for call in create_task.call_args_list}
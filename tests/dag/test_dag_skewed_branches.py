@@ -0,0 +1,60 @@
+import asyncio
+import typing as t
+
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.types import PipelineChartLike
+
+
+class FastBranchDone:
+    event: t.Optional[asyncio.Event] = None
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class SlowNode(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        # The node can't finish until the fast branch is completed
+        await FastBranchDone.event.wait()
+        return num
+
+
+class AfterSlowNode(ProcessorBase):
+    async def process(self, num: Input(SlowNode)) -> float:
+        return num
+
+
+class FastNode(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        return num
+
+
+class FastNodeSecond(ProcessorBase):
+    async def process(self, num: Input(FastNode)) -> float:
+        return num
+
+
+class FastNodeThird(ProcessorBase):
+    async def process(self, num: Input(FastNodeSecond)) -> float:
+        FastBranchDone.event.set()
+        return num
+
+
+class Out(ProcessorBase):
+    async def process(self, slow: Input(AfterSlowNode), fast: Input(FastNodeThird)) -> float:
+        return slow + fast
+
+
+async def test_dag_skewed_branches(
+    build_chart: t.Callable[..., PipelineChartLike],
+) -> None:
+    FastBranchDone.event = asyncio.Event()
+
+    chart = build_chart(input_node=Ident, output_node=Out)
+    result = await asyncio.wait_for(chart.run(input_kwargs=dict(num=1.0)), timeout=5)
+
+    assert result.value == 2.0
+    assert result.error is None
@@ -2,8 +2,11 @@ import typing as t
 
 import pytest_mock
 
+from ml_pipeline_engine.dag_builders.annotation import build_dag
 from ml_pipeline_engine.dag_builders.annotation.marks import Input
 from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import get_node_id
+from ml_pipeline_engine.node.enums import ExecMode
 from ml_pipeline_engine.node.enums import NodeTag
 from ml_pipeline_engine.parallelism import processes
 from ml_pipeline_engine.parallelism import threads
@@ -66,3 +69,35 @@ async def test_tags__with_thread_process(
 
     assert threads_get_pool_executor.call_count == 1
     assert processes_get_pool_executor.call_count == 2
+
+
+def test_tags__exec_modes() -> None:
+    dag = build_dag(input_node=SomeInput, output_node=SomeMLModel)
+    layout = dag.layout
+
+    assert {node_id: layout.exec_modes[layout.node_index[node_id]] for node_id in layout.node_ids} == {
+        get_node_id(SomeInput): ExecMode.process,
+        get_node_id(SomeDataSource): ExecMode.thread,
+        get_node_id(SomeFeature): ExecMode.process,
+        get_node_id(SomeVectorizer): ExecMode.inline,
+        get_node_id(SomeMLModel): ExecMode.coroutine,
+    }
+    assert dag.is_process_pool_needed is True
+    assert dag.is_thread_pool_needed is True
+
+
+def test_tags__non_async_does_not_need_thread_pool() -> None:
+    class InlineInput(ProcessorBase):
+        tags = (NodeTag.non_async,)
+
+        def process(self, num: int) -> int:
+            return num
+
+    class AsyncOutput(ProcessorBase):
+        async def process(self, num: Input(InlineInput)) -> int:
+            return num
+
+    dag = build_dag(input_node=InlineInput, output_node=AsyncOutput)
+
+    assert dag.is_process_pool_needed is False
+    assert dag.is_thread_pool_needed is False
@@ -8,7 +8,9 @@ from ml_pipeline_engine.chart import PipelineChart
 from ml_pipeline_engine.context.dag import DAGPipelineContext
 from ml_pipeline_engine.dag_builders.annotation import build_dag
 from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.events import EventSourceMixin
 from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.types import NodeEvent
 from ml_pipeline_engine.types import NodeId
 from ml_pipeline_engine.types import PipelineContextLike
 from ml_pipeline_engine.types import PipelineResult
@@ -182,3 +184,91 @@ async def test_pipeline_chart_events_error(mocker: pytest_mock.MockerFixture, mo
     }
 
     assert isinstance(on_node_complete.call_args_list[1].kwargs['error'], ZeroDivisionError)
+
+
+async def test_pipeline_chart_events_batched(mocker: pytest_mock.MockerFixture, model_name_op: str) -> None:
+    class SomeDataSourceNode(ProcessorBase):
+        name = 'some_datasource'
+
+        def process(self, x: int) -> int:
+            return x * -1
+
+    class SomeOutputNode(ProcessorBase):
+        name = 'some_output'
+
+        def process(self, num: Input(SomeDataSourceNode)) -> float:
+            return num / 0
+
+    class BatchedEvents:
+        batched = True
+
+        async def on_pipeline_complete(self, ctx: PipelineContextLike, result: PipelineResult) -> None:
+            ...
+
+        async def on_node_start(self, ctx: PipelineContextLike, node_id: NodeId) -> None:
+            ...
+
+        async def on_node_events_batch(self, ctx: PipelineContextLike, events: t.List[NodeEvent]) -> None:
+            ...
+
+    class TestingEvents:
+        async def on_node_start(self, ctx: PipelineContextLike, node_id: NodeId) -> None:
+            ...
+
+    manager = mocker.Mock()
+    manager.attach_mock(mocker.spy(BatchedEvents, 'on_node_events_batch'), 'on_node_events_batch')
+    manager.attach_mock(mocker.spy(BatchedEvents, 'on_pipeline_complete'), 'on_pipeline_complete')
+    batched_on_node_start = mocker.spy(BatchedEvents, 'on_node_start')
+    on_node_start = mocker.spy(TestingEvents, 'on_node_start')
+
+    some_model_pipeline = PipelineChart(
+        model_name=model_name_op,
+        entrypoint=build_dag(input_node=SomeDataSourceNode, output_node=SomeOutputNode),
+        event_managers=[
+            BatchedEvents,
+            TestingEvents,
+        ],
+    )
+
+    await some_model_pipeline.run(input_kwargs=dict(x=2))
+
+    batched_on_node_start.assert_not_called()
+    assert on_node_start.call_count == 2
+
+    assert [call[0] for call in manager.mock_calls] == ['on_node_events_batch', 'on_pipeline_complete']
+
+    events = manager.on_node_events_batch.call_args.kwargs['events']
+    assert [(event.name, event.node_id) for event in events] == [
+        ('on_node_start', 'processor__some_datasource'),
+        ('on_node_complete', 'processor__some_datasource'),
+        ('on_node_start', 'processor__some_output'),
+        ('on_node_complete', 'processor__some_output'),
+    ]
+    assert [event.error for event in events[:3]] == [None, None, None]
+    assert isinstance(events[3].error, ZeroDivisionError)
+    assert all(prev.timestamp <= event.timestamp for prev, event in zip(events, events[1:]))
+
+
+async def test_event_source_mixin_batched_events(mocker: pytest_mock.MockerFixture) -> None:
+    class BatchedEvents:
+        batched = True
+
+        async def on_node_events_batch(self, ctx: PipelineContextLike, events: t.List[NodeEvent]) -> None:
+            ...
+
+    class SomeEventSource(EventSourceMixin):
+        def _get_event_managers(self) -> t.List[BatchedEvents]:
+            return [BatchedEvents()]
+
+    on_node_events_batch = mocker.spy(BatchedEvents, 'on_node_events_batch')
+    source = SomeEventSource()
+
+    await source.emit_on_node_start(node_id='some_node')
+    await source.emit_on_node_complete(node_id='some_node', error=None)
+    await source.emit_on_pipeline_complete(result=PipelineResult(pipeline_id=UUID(int=0), value=None, error=None))
+
+    events = on_node_events_batch.call_args.kwargs['events']
+    assert [(event.name, event.node_id) for event in events] == [
+        ('on_node_start', 'some_node'),
+        ('on_node_complete', 'some_node'),
+    ]
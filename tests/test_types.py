@@ -0,0 +1,24 @@
+import pickle
+import sys
+import typing as t
+
+import pytest
+
+from ml_pipeline_engine.types import CaseResult
+from ml_pipeline_engine.types import PipelineResult
+from ml_pipeline_engine.types import Recurrent
+
+
+@pytest.mark.parametrize(
+    'obj',
+    [
+        Recurrent(data={'x': 1}),
+        CaseResult(label='a', node_id='b'),
+        PipelineResult(pipeline_id='some-id', value=1, error=None),
+    ],
+)
+def test_slotted_results_are_picklable(obj: t.Any) -> None:
+    assert pickle.loads(pickle.dumps(obj)) == obj
+
+    if sys.version_info >= (3, 10):
+        assert not hasattr(obj, '__dict__')
@@ -1,9 +1,13 @@
+import sys
 import typing as t
 from uuid import UUID
 
 import pytest
 
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
 from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import generate_node_id
 from ml_pipeline_engine.node import generate_pipeline_id
 from ml_pipeline_engine.node import get_node_id
 from ml_pipeline_engine.node import run_node
@@ -28,6 +32,22 @@ def test_get_id() -> None:
     assert get_node_id(type(SomeNode())) == 'some-node-type__some-node'
 
 
+def test_node_ids_are_interned() -> None:
+    class SomeNode(ProcessorBase):
+        def process(self, num: float) -> float:
+            return num
+
+    class OtherNode(ProcessorBase):
+        def process(self, num: Input(SomeNode)) -> float:
+            return num
+
+    assert get_node_id(SomeNode) is get_node_id(SomeNode)
+    assert generate_node_id('some-prefix', 'some-name') is sys.intern('some-prefix__some-name')
+
+    dag = build_dag(input_node=SomeNode, output_node=OtherNode)
+    assert all(sys.intern(node_id) is node_id for node_id in (*dag.node_map, *dag.graph.nodes))
+
+
 async def test_run_method() -> None:
     class SomeNode(ProcessorBase):
         @staticmethod